@@ -1,5 +1,4 @@
 import os
-from openai import OpenAI
 
 
 class AINarrative:
@@ -7,6 +6,9 @@ class AINarrative:
         api_key = os.getenv("GROQ_API_KEY")
 
         if api_key:
+            # Imported here so sessions without an LLM key never pay for the SDK import
+            from openai import OpenAI
+
             self.client = OpenAI(
                 api_key=api_key,
                 base_url="https://api.groq.com/openai/v1"
@@ -95,6 +97,70 @@ class AINarrative:
                 "confidence_score": "High"
             }
 
+        if intent == "funnel":
+            funnel = metrics["funnel"]
+            weakest = funnel["weakest_stage"]
+            stages = funnel["stage_order"]
+            top_risk_stage = max(stages, key=lambda s: funnel["stage_value_at_risk"][s])
+            slowest_stage = max(stages, key=lambda s: funnel["stage_cycle_distribution"][s]["median"])
+
+            return {
+                "executive_summary": (
+                    f"{weakest['weakest_stage']} has the lowest win rate in the funnel, "
+                    f"converting at {weakest['win_rate']*100:.2f}%. "
+                    f"{top_risk_stage} carries the largest value at risk "
+                    f"({funnel['stage_value_at_risk'][top_risk_stage]:,.0f})."
+                ),
+                "key_risks": [
+                    f"Lowest win-rate stage: {weakest['weakest_stage']} ({weakest['win_rate']*100:.2f}%)",
+                    f"Highest value at risk: {top_risk_stage}",
+                    f"Slowest stage: {slowest_stage} "
+                    f"(median {funnel['stage_cycle_distribution'][slowest_stage]['median']} days)"
+                ],
+                "data_insights": [
+                    f"{stage} Win Rate: {funnel['stage_win_rates'][stage]*100:.2f}%"
+                    for stage in stages
+                ],
+                "recommended_actions": [
+                    f"Review exit criteria and deal coaching at the {weakest['weakest_stage']} stage.",
+                    f"Prioritize high-risk opportunities sitting in {top_risk_stage}.",
+                    "Set stage-level cycle time targets to surface stuck deals earlier."
+                ],
+                "confidence_score": "High"
+            }
+
+        if intent == "rep_performance":
+            reps = metrics["rep_performance"]
+            top = reps["top_rep"]
+            bottom = reps["bottom_rep"]
+            medians = reps["team_medians"]
+
+            return {
+                "executive_summary": (
+                    f"{top['sales_rep_id']} leads {reps['total_reps']} reps with a "
+                    f"{top['win_rate']*100:.2f}% win rate against a team median of "
+                    f"{medians['win_rate']*100:.2f}%. "
+                    f"{bottom['sales_rep_id']} trails at {bottom['win_rate']*100:.2f}%."
+                ),
+                "key_risks": [
+                    f"Lowest win rate: {bottom['sales_rep_id']} ({bottom['win_rate']*100:.2f}%)",
+                    f"Bottom rep stalled share: {bottom['stalled_share']*100:.2f}%",
+                    f"Bottom rep average risk score: {bottom['avg_risk']:.2f}"
+                ],
+                "data_insights": [
+                    f"Team Median Win Rate: {medians['win_rate']*100:.2f}%",
+                    f"Team Median ACV: {medians['avg_acv']:,.2f}",
+                    f"Team Median Sales Cycle: {medians['avg_cycle']:.2f} days",
+                    f"Team Median Stalled Share: {medians['stalled_share']*100:.2f}%"
+                ],
+                "recommended_actions": [
+                    f"Pair {bottom['sales_rep_id']} with top performers for deal reviews.",
+                    "Standardize qualification practices used by the top quartile.",
+                    "Review stalled deals for reps above the team median stalled share."
+                ],
+                "confidence_score": "High"
+            }
+
         if intent == "stalled":
             return {
                 "executive_summary": (
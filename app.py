@@ -1,9 +1,8 @@
+import os
 import streamlit as st
 import json
 
-from decision_engine import DecisionEngine
-from risk_model import RiskModel
-from health_index import HealthIndex
+from snapshot import DatasetRefresher
 from guardrails import Guardrails
 from intent_router import route_visuals
 from ai_narrative import AINarrative
@@ -27,7 +26,9 @@ suggestions = [
     "Are deals stalling?",
     "Analyze pipeline health",
     "Where is risk concentrated?",
-    "What is our win rate by lead source?"
+    "What is our win rate by lead source?",
+    "Where in the funnel are we losing deals?",
+    "Show the sales rep leaderboard"
 ]
 
 if "query_input" not in st.session_state:
@@ -41,30 +42,60 @@ for suggestion in suggestions:
 st.markdown("---")
 
 # -----------------------------
-# Load Data + Core Engines
+# Dataset Snapshot (pre-warmed in background)
 # -----------------------------
-engine = DecisionEngine("data/skygeni_sales_data.csv")
-metrics = engine.compute_all_metrics()
+@st.cache_resource
+def get_refresher(file_path):
+    refresher = DatasetRefresher(file_path, backend=os.getenv("SKYGENI_BACKEND", "pandas"))
+    refresher.start()
+    return refresher
 
-risk_model = RiskModel(engine.df)
-risk_df = risk_model.compute_risk_score()
-risk_summary = risk_model.portfolio_risk_summary()
 
-health_model = HealthIndex(metrics, risk_summary)
-health_score = health_model.compute_health_score()
-health_label = health_model.health_label(health_score)
+refresher = get_refresher("data/skygeni_sales_data.csv")
 
 guard = Guardrails()
 
 # -----------------------------
-# Sidebar Dynamic Checklist
+# User Query Input
+# -----------------------------
+query = st.text_input(
+    "Ask a sales intelligence question:",
+    value=st.session_state.query_input,
+    key="main_query_box"
+)
+
+# -----------------------------
+# Wait for Core Engines
 # -----------------------------
 st.sidebar.title("System Status")
 
+if not refresher.is_ready():
+    with st.spinner("Loading sales dataset and computing metrics..."):
+        refresher.current()
+
+snapshot = refresher.current(timeout=0)
+
+if snapshot is None:
+    st.sidebar.error("✘ Dataset Loaded")
+    st.error(f"Sales dataset could not be loaded: {refresher.last_error}")
+    st.stop()
+
+engine = snapshot.engine
+metrics = snapshot.metrics
+risk_df = snapshot.risk_df
+risk_summary = snapshot.risk_summary
+health_score = snapshot.health_score
+health_label = snapshot.health_label
+
+# -----------------------------
+# Sidebar Dynamic Checklist
+# -----------------------------
 status_items = {
     "Dataset Loaded": engine is not None,
     "Metrics Computed": metrics is not None,
     "Risk Model Active": risk_summary is not None,
+    "Funnel Analytics Ready": metrics.get("funnel") is not None,
+    "Rep Leaderboard Ready": metrics.get("rep_performance") is not None,
     "Health Index Generated": health_score is not None,
     "Guardrails Active": True,
     "Visualization Routing Ready": True,
@@ -77,14 +108,11 @@ for label, condition in status_items.items():
     else:
         st.sidebar.error(f"✘ {label}")
 
-# -----------------------------
-# User Query Input
-# -----------------------------
-query = st.text_input(
-    "Ask a sales intelligence question:",
-    value=st.session_state.query_input,
-    key="main_query_box"
-)
+st.sidebar.markdown("---")
+st.sidebar.caption(f"Snapshot v{snapshot.version} ({snapshot.backend_name}) · built {snapshot.age_seconds():.0f}s ago")
+
+if refresher.last_error:
+    st.sidebar.warning(f"Last refresh failed, serving v{snapshot.version}: {refresher.last_error}")
 
 # -----------------------------
 # Process Query
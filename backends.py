@@ -0,0 +1,377 @@
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+
+class MetricsBackend(ABC):
+    """Execution interface used by DecisionEngine and RiskModel.
+
+    Backends return raw (unrounded) values; rounding and presentation stay
+    in the engine so every backend produces identical metric dictionaries.
+    """
+
+    @property
+    @abstractmethod
+    def df(self):
+        ...
+
+    @abstractmethod
+    def columns(self):
+        ...
+
+    @abstractmethod
+    def count(self):
+        ...
+
+    @abstractmethod
+    def mean(self, column):
+        ...
+
+    @abstractmethod
+    def median(self, column):
+        ...
+
+    @abstractmethod
+    def max(self, column):
+        ...
+
+    @abstractmethod
+    def sum(self, column):
+        ...
+
+    @abstractmethod
+    def count_greater(self, column, threshold):
+        ...
+
+    @abstractmethod
+    def closed_win_rate(self):
+        ...
+
+    @abstractmethod
+    def win_rate_by(self, column):
+        ...
+
+    @abstractmethod
+    def quarterly_win_rates(self):
+        ...
+
+    @abstractmethod
+    def risk_frame(self, params):
+        ...
+
+    @abstractmethod
+    def risk_summary(self, params):
+        ...
+
+
+# -----------------------------
+# Pandas (in-memory) Backend
+# -----------------------------
+
+class PandasBackend(MetricsBackend):
+    def __init__(self, file_path=None, df=None, filters=None):
+        self.file_path = file_path
+        self.filters = filters or {}
+
+        if df is None:
+            df = self.clean_data(self.load_data())
+        self._df = self.apply_filters(df)
+
+    def load_data(self):
+        return pd.read_csv(self.file_path)
+
+    @staticmethod
+    def clean_data(df):
+        df["created_date"] = pd.to_datetime(df["created_date"], errors="coerce")
+        df["closed_date"] = pd.to_datetime(df["closed_date"], errors="coerce")
+        df["outcome"] = df["outcome"].str.lower().str.strip()
+        return df.dropna(subset=["deal_amount", "sales_cycle_days"])
+
+    def apply_filters(self, df):
+        for column, value in self.filters.items():
+            df = df[df[column] == value]
+        return df
+
+    @property
+    def df(self):
+        return self._df
+
+    def columns(self):
+        return list(self._df.columns)
+
+    def _closed(self):
+        return self._df[self._df["outcome"].isin(["won", "lost"])]
+
+    # -----------------------------
+    # Aggregations
+    # -----------------------------
+
+    def count(self):
+        return len(self._df)
+
+    def mean(self, column):
+        return self._df[column].mean()
+
+    def median(self, column):
+        return self._df[column].median()
+
+    def max(self, column):
+        return self._df[column].max()
+
+    def sum(self, column):
+        return self._df[column].sum()
+
+    def count_greater(self, column, threshold):
+        return int((self._df[column] > threshold).sum())
+
+    def closed_win_rate(self):
+        closed = self._closed()
+        if len(closed) == 0:
+            return None
+        return (closed["outcome"] == "won").mean()
+
+    def win_rate_by(self, column):
+        closed = self._closed()
+        return (closed["outcome"] == "won").groupby(closed[column]).mean()
+
+    def quarterly_win_rates(self):
+        closed = self._closed()
+        quarters = closed["created_date"].dt.to_period("Q")
+        return (closed["outcome"] == "won").groupby(quarters).mean()
+
+    # -----------------------------
+    # Risk Scoring
+    # -----------------------------
+
+    def risk_frame(self, params):
+        df = self._df.copy()
+        weights = params["weights"]
+
+        df["cycle_risk"] = df["sales_cycle_days"] / params["max_cycle"]
+        df["acv_risk"] = (params["median_acv"] - df["deal_amount"]) / params["median_acv"]
+        df["lead_source_risk"] = df["lead_source"].map(params["lead_source_risk"]).fillna(
+            params["default_source_risk"]
+        )
+        df["stall_risk"] = (df["sales_cycle_days"] > params["stall_threshold"]).astype(int)
+
+        df["risk_score"] = sum(weights[component] * df[component] for component in weights)
+        df["risk_score"] = (df["risk_score"] * 100).clip(0, 100)
+
+        return df
+
+    def risk_summary(self, params):
+        scores = self.risk_frame(params)["risk_score"]
+        high, medium = params["high_risk_threshold"], params["medium_risk_threshold"]
+
+        return {
+            "average_risk_score": scores.mean(),
+            "high_risk_count": int((scores > high).sum()),
+            "medium_risk_count": int(((scores > medium) & (scores <= high)).sum()),
+            "low_risk_count": int((scores <= medium).sum()),
+            "total": len(scores)
+        }
+
+
+# -----------------------------
+# DuckDB (embedded SQL) Backend
+# -----------------------------
+
+def _sql_literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(float(value))
+
+
+def _sql_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBBackend(MetricsBackend):
+    """Runs metrics as vectorized SQL over a CSV or Parquet file.
+
+    The file is loaded once into an in-memory DuckDB table; it is only
+    materialized as a pandas frame when ``df`` or the risk frame is read
+    (charts, funnel and rep analytics still work on frames), and ``df``
+    reuses the risk frame when that was built first.
+    """
+
+    def __init__(self, file_path, filters=None, threads=None):
+        try:
+            import duckdb
+        except ImportError as exc:
+            raise ImportError(
+                "DuckDBBackend requires the 'duckdb' package (pip install duckdb)."
+            ) from exc
+
+        self.file_path = file_path
+        self.filters = filters or {}
+        self.con = duckdb.connect()
+        if threads:
+            self.con.execute(f"SET threads TO {int(threads)}")
+
+        self._df = None
+        self.con.execute(self._deals_table_sql())
+
+    def _source_sql(self):
+        path = _sql_literal(str(self.file_path))
+        if str(self.file_path).endswith(".parquet"):
+            return f"read_parquet({path})"
+        return f"read_csv_auto({path})"
+
+    def _deals_table_sql(self):
+        conditions = ["deal_amount IS NOT NULL", "sales_cycle_days IS NOT NULL"]
+        conditions += [
+            f"{_sql_identifier(column)} = {_sql_literal(value)}"
+            for column, value in self.filters.items()
+        ]
+
+        # Read the file once into a table on this connection. Every metric,
+        # the risk frame and .df then see the same version of the file even
+        # if it is replaced while a snapshot is being built.
+        return f"""
+            CREATE TABLE deals AS
+            SELECT * REPLACE (
+                TRY_CAST(created_date AS TIMESTAMP) AS created_date,
+                TRY_CAST(closed_date AS TIMESTAMP) AS closed_date,
+                lower(trim(outcome)) AS outcome
+            )
+            FROM {self._source_sql()}
+            WHERE {" AND ".join(conditions)}
+        """
+
+    def _scalar(self, sql):
+        return self.con.execute(sql).fetchone()[0]
+
+    @property
+    def df(self):
+        if self._df is None:
+            self._df = self.con.execute("SELECT * FROM deals").df()
+        return self._df
+
+    def columns(self):
+        return [row[0] for row in self.con.execute("DESCRIBE deals").fetchall()]
+
+    # -----------------------------
+    # Aggregations
+    # -----------------------------
+
+    def count(self):
+        return self._scalar("SELECT count(*) FROM deals")
+
+    def mean(self, column):
+        return self._scalar(f"SELECT avg({_sql_identifier(column)}) FROM deals")
+
+    def median(self, column):
+        return self._scalar(f"SELECT median({_sql_identifier(column)}) FROM deals")
+
+    def max(self, column):
+        return self._scalar(f"SELECT max({_sql_identifier(column)}) FROM deals")
+
+    def sum(self, column):
+        return self._scalar(f"SELECT sum({_sql_identifier(column)}) FROM deals")
+
+    def count_greater(self, column, threshold):
+        return self._scalar(
+            f"SELECT count(*) FROM deals WHERE {_sql_identifier(column)} > {_sql_literal(threshold)}"
+        )
+
+    def closed_win_rate(self):
+        return self._scalar("""
+            SELECT avg(CASE WHEN outcome = 'won' THEN 1.0 ELSE 0.0 END)
+            FROM deals
+            WHERE outcome IN ('won', 'lost')
+        """)
+
+    def win_rate_by(self, column):
+        column = _sql_identifier(column)
+        result = self.con.execute(f"""
+            SELECT {column} AS key, avg(CASE WHEN outcome = 'won' THEN 1.0 ELSE 0.0 END) AS win_rate
+            FROM deals
+            WHERE outcome IN ('won', 'lost') AND {column} IS NOT NULL
+            GROUP BY 1
+            ORDER BY 1
+        """).df()
+        return pd.Series(result["win_rate"].to_numpy(), index=result["key"].to_numpy())
+
+    def quarterly_win_rates(self):
+        result = self.con.execute("""
+            SELECT date_trunc('quarter', created_date) AS quarter,
+                   avg(CASE WHEN outcome = 'won' THEN 1.0 ELSE 0.0 END) AS win_rate
+            FROM deals
+            WHERE outcome IN ('won', 'lost') AND created_date IS NOT NULL
+            GROUP BY 1
+            ORDER BY 1
+        """).df()
+        quarters = pd.PeriodIndex(pd.to_datetime(result["quarter"]), freq="Q")
+        return pd.Series(result["win_rate"].to_numpy(), index=quarters)
+
+    # -----------------------------
+    # Risk Scoring
+    # -----------------------------
+
+    def _risk_select_sql(self, params):
+        source_cases = " ".join(
+            f"WHEN {_sql_literal(source)} THEN {_sql_literal(risk)}"
+            for source, risk in params["lead_source_risk"].items()
+        )
+        weighted = " + ".join(
+            f"{_sql_literal(weight)} * {component}"
+            for component, weight in params["weights"].items()
+        )
+
+        return f"""
+            WITH components AS (
+                SELECT *,
+                    sales_cycle_days / {_sql_literal(params["max_cycle"])} AS cycle_risk,
+                    ({_sql_literal(params["median_acv"])} - deal_amount)
+                        / {_sql_literal(params["median_acv"])} AS acv_risk,
+                    CASE lead_source {source_cases}
+                        ELSE {_sql_literal(params["default_source_risk"])} END AS lead_source_risk,
+                    CAST(sales_cycle_days > {_sql_literal(params["stall_threshold"])} AS INTEGER)
+                        AS stall_risk
+                FROM deals
+            )
+            SELECT *, least(greatest(({weighted}) * 100, 0), 100) AS risk_score
+            FROM components
+        """
+
+    def risk_frame(self, params):
+        frame = self.con.execute(self._risk_select_sql(params)).df()
+        # The risk frame carries every deal column, so .df can reuse it
+        # instead of pulling the table into pandas a second time.
+        if self._df is None:
+            self._df = frame
+        return frame
+
+    def risk_summary(self, params):
+        high = _sql_literal(params["high_risk_threshold"])
+        medium = _sql_literal(params["medium_risk_threshold"])
+
+        row = self.con.execute(f"""
+            SELECT avg(risk_score),
+                   count_if(risk_score > {high}),
+                   count_if(risk_score > {medium} AND risk_score <= {high}),
+                   count_if(risk_score <= {medium}),
+                   count(*)
+            FROM ({self._risk_select_sql(params)})
+        """).fetchone()
+
+        return {
+            "average_risk_score": row[0],
+            "high_risk_count": row[1],
+            "medium_risk_count": row[2],
+            "low_risk_count": row[3],
+            "total": row[4]
+        }
+
+
+BACKENDS = {
+    "pandas": PandasBackend,
+    "duckdb": DuckDBBackend,
+}
+
+
+def get_backend(name, file_path, **kwargs):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Choose one of {list(BACKENDS)}.")
+    return BACKENDS[name](file_path, **kwargs)
@@ -0,0 +1,64 @@
+# Benchmark for the metric backends. Builds scaled copies of the sample
+# dataset and times metric + risk computation for each backend.
+#
+#   python bench_backends.py [copies ...]
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from backends import BACKENDS
+from decision_engine import DecisionEngine
+from risk_model import RiskModel
+
+
+DATA_PATH = "data/skygeni_sales_data.csv"
+
+
+def write_scaled(directory, copies):
+    base = pd.read_csv(DATA_PATH)
+    frames = []
+    for i in range(copies):
+        frame = base.copy()
+        frame["deal_id"] = frame["deal_id"] + f"_{i}"
+        frames.append(frame)
+    scaled = pd.concat(frames, ignore_index=True)
+
+    path = os.path.join(directory, f"deals_x{copies}.csv")
+    scaled.to_csv(path, index=False)
+    return path, len(scaled)
+
+
+def run(backend_name, path):
+    start = time.perf_counter()
+    engine = DecisionEngine(path, backend=BACKENDS[backend_name](path))
+    loaded = time.perf_counter()
+
+    engine.compute_all_metrics()
+    RiskModel(backend=engine.backend).portfolio_risk_summary()
+    done = time.perf_counter()
+
+    return loaded - start, done - loaded
+
+
+def main(copies_list):
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'rows':>10} {'backend':>8} {'load (s)':>10} {'metrics+risk (s)':>18} {'total (s)':>10}")
+
+        for copies in copies_list:
+            path, rows = write_scaled(directory, copies)
+
+            for backend_name in BACKENDS:
+                try:
+                    load, compute = run(backend_name, path)
+                except ImportError as exc:
+                    print(f"{rows:>10} {backend_name:>8} skipped: {exc}")
+                    continue
+                print(f"{rows:>10} {backend_name:>8} {load:>10.3f} {compute:>18.3f} {load + compute:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1, 20, 200])
@@ -0,0 +1,56 @@
+# Benchmark for RepAnalytics: full bincount rebuild against the incremental
+# path used on snapshot refresh, on synthetic data with thousands of reps.
+#
+#   python bench_rep_analytics.py [deals] [reps] [changed]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from rep_analytics import RepAnalytics
+
+
+def synthetic_deals(n_deals, n_reps, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "deal_id": [f"D{i:07d}" for i in range(n_deals)],
+        "sales_rep_id": [f"rep_{i}" for i in rng.integers(0, n_reps, n_deals)],
+        "outcome": rng.choice(["won", "lost"], n_deals),
+        "deal_amount": rng.integers(500, 50000, n_deals),
+        "sales_cycle_days": rng.integers(5, 120, n_deals),
+        "risk_score": rng.uniform(0, 100, n_deals),
+    })
+
+
+def timed(label, fn, runs=3):
+    best = min(_once(fn) for _ in range(runs))
+    print(f"{label:>40}: {best:.3f}s (best of {runs})")
+    return best
+
+
+def _once(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(n_deals, n_reps, n_changed):
+    df = synthetic_deals(n_deals, n_reps)
+    analytics = RepAnalytics(df)
+
+    changed = df.copy()
+    flip = changed.index[:n_changed]
+    changed.loc[flip, "outcome"] = np.where(changed.loc[flip, "outcome"] == "won", "lost", "won")
+
+    print(f"{n_deals} deals, {n_reps} reps, {n_changed} changed")
+    rebuild = timed("full rebuild RepAnalytics(df)", lambda: RepAnalytics(changed))
+    incremental = timed(f"updated() with {n_changed} changed", lambda: analytics.updated(changed))
+    timed("updated() with no changes", lambda: analytics.updated(df))
+    print(f"{'incremental speed-up':>40}: {rebuild / incremental:.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [500_000, 5_000, 100][len(args):]))
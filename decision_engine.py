@@ -1,43 +1,43 @@
 import pandas as pd
 
+from backends import PandasBackend
+
 
 class DecisionEngine:
-    def __init__(self, file_path):
+    def __init__(self, file_path, backend=None):
         self.file_path = file_path
-        self.df = self.load_data()
-        self.clean_data()
+        self.backend = backend if backend is not None else PandasBackend(file_path)
+
+    @property
+    def df(self):
+        # Read-only: the cleaned frame is owned by the backend
+        return self.backend.df
 
     def load_data(self):
         return pd.read_csv(self.file_path)
 
-    def clean_data(self):
-        self.df["created_date"] = pd.to_datetime(self.df["created_date"], errors="coerce")
-        self.df["closed_date"] = pd.to_datetime(self.df["closed_date"], errors="coerce")
-        self.df["outcome"] = self.df["outcome"].str.lower().str.strip()
-        self.df = self.df.dropna(subset=["deal_amount", "sales_cycle_days"])
+    def clean_data(self, df=None):
+        # Returns a cleaned copy of the raw file instead of mutating self.df
+        if df is None:
+            df = self.load_data()
+        return PandasBackend.clean_data(df)
 
     # -----------------------------
     # Core Metrics
     # -----------------------------
 
     def overall_win_rate(self):
-        closed = self.df[self.df["outcome"].isin(["won", "lost"])]
-        if len(closed) == 0:
+        win_rate = self.backend.closed_win_rate()
+        if win_rate is None:
             return 0
-        return round((closed["outcome"] == "won").mean(), 4)
+        return round(win_rate, 4)
 
     def win_rate_by_lead_source(self):
-        closed = self.df[self.df["outcome"].isin(["won", "lost"])]
-        grouped = closed.groupby("lead_source")["outcome"].apply(
-            lambda x: (x == "won").mean()
-        )
+        grouped = self.backend.win_rate_by("lead_source")
         return grouped.round(4).to_dict()
 
     def weakest_lead_source(self):
-        closed = self.df[self.df["outcome"].isin(["won", "lost"])]
-        grouped = closed.groupby("lead_source")["outcome"].apply(
-            lambda x: (x == "won").mean()
-        )
+        grouped = self.backend.win_rate_by("lead_source")
         weakest = grouped.idxmin()
         return {
             "weakest_source": weakest,
@@ -45,12 +45,7 @@ class DecisionEngine:
         }
 
     def win_rate_trend(self):
-        df = self.df[self.df["outcome"].isin(["won", "lost"])].copy()
-        df["year_quarter"] = df["created_date"].dt.to_period("Q")
-
-        quarterly_win = df.groupby("year_quarter")["outcome"].apply(
-            lambda x: (x == "won").mean()
-        )
+        quarterly_win = self.backend.quarterly_win_rates()
 
         if len(quarterly_win) < 2:
             return {"trend_direction": "Insufficient data"}
@@ -71,22 +66,22 @@ class DecisionEngine:
         }
 
     def average_sales_cycle(self):
-        return round(self.df["sales_cycle_days"].mean(), 2)
+        return round(self.backend.mean("sales_cycle_days"), 2)
 
     def median_sales_cycle(self):
-        return round(self.df["sales_cycle_days"].median(), 2)
+        return round(self.backend.median("sales_cycle_days"), 2)
 
     def stalled_deal_percentage(self):
         median_cycle = self.median_sales_cycle()
         threshold = 1.5 * median_cycle
-        stalled = self.df[self.df["sales_cycle_days"] > threshold]
-        return round(len(stalled) / len(self.df), 4)
+        stalled = self.backend.count_greater("sales_cycle_days", threshold)
+        return round(stalled / self.backend.count(), 4)
 
     def acv_stats(self):
         return {
-            "mean_acv": round(self.df["deal_amount"].mean(), 2),
-            "median_acv": round(self.df["deal_amount"].median(), 2),
-            "total_revenue": round(self.df["deal_amount"].sum(), 2)
+            "mean_acv": round(self.backend.mean("deal_amount"), 2),
+            "median_acv": round(self.backend.median("deal_amount"), 2),
+            "total_revenue": round(self.backend.sum("deal_amount"), 2)
         }
 
     # -----------------------------
@@ -103,5 +98,5 @@ class DecisionEngine:
             "median_sales_cycle": self.median_sales_cycle(),
             "stalled_deal_percentage": self.stalled_deal_percentage(),
             "acv_stats": self.acv_stats(),
-            "total_deals": len(self.df)
+            "total_deals": self.backend.count()
         }
@@ -0,0 +1,118 @@
+import pandas as pd
+
+
+STAGE_ORDER = ["Qualified", "Demo", "Proposal", "Negotiation", "Closed"]
+
+
+class FunnelAnalytics:
+    def __init__(self, df, segment="product_type", high_risk_threshold=60):
+        self.df = df
+        self.segment = segment
+        self.high_risk_threshold = high_risk_threshold
+        self.crosstab = self.build_crosstab()
+
+    # -----------------------------
+    # Stage x Outcome x Segment Crosstab
+    # -----------------------------
+
+    def build_crosstab(self):
+        # Single grouped pass; every stage-level view below is a
+        # re-aggregation of this frame rather than a new scan of self.df.
+        df = self.df
+        won = (df["outcome"] == "won").astype(int)
+        closed = df["outcome"].isin(["won", "lost"]).astype(int)
+
+        if "risk_score" in df.columns:
+            at_risk = df["risk_score"] > self.high_risk_threshold
+        else:
+            at_risk = df["sales_cycle_days"] > 1.5 * df["sales_cycle_days"].median()
+
+        frame = pd.DataFrame({
+            "deal_stage": df["deal_stage"],
+            "segment": df[self.segment],
+            "outcome": df["outcome"],
+            "deals": 1,
+            "won": won,
+            "closed": closed,
+            "value_at_risk": df["deal_amount"].where(at_risk, 0),
+        })
+
+        return frame.groupby(
+            ["deal_stage", "segment", "outcome"], observed=True
+        )[["deals", "won", "closed", "value_at_risk"]].sum()
+
+    def stage_order(self):
+        present = self.crosstab.index.get_level_values("deal_stage").unique()
+        ordered = [stage for stage in STAGE_ORDER if stage in present]
+        return ordered + sorted(stage for stage in present if stage not in STAGE_ORDER)
+
+    def _by_stage(self):
+        return self.crosstab.groupby(level="deal_stage").sum().reindex(self.stage_order())
+
+    # -----------------------------
+    # Stage Metrics
+    # -----------------------------
+
+    def stage_deal_counts(self):
+        return self._by_stage()["deals"].astype(int).to_dict()
+
+    def stage_win_rates(self):
+        by_stage = self._by_stage()
+        rates = (by_stage["won"] / by_stage["closed"].where(by_stage["closed"] > 0)).fillna(0)
+        return rates.round(4).to_dict()
+
+    def stage_value_at_risk(self):
+        return self._by_stage()["value_at_risk"].round(2).to_dict()
+
+    def segment_win_rates(self):
+        by_segment = self.crosstab.groupby(level=["deal_stage", "segment"]).sum()
+        rates = (by_segment["won"] / by_segment["closed"].where(by_segment["closed"] > 0)).fillna(0)
+        rates = rates.round(4)
+
+        return {
+            stage: rates.loc[stage].to_dict()
+            for stage in self.stage_order()
+            if stage in rates.index.get_level_values("deal_stage")
+        }
+
+    def weakest_stage(self):
+        rates = self.stage_win_rates()
+        if not rates:
+            return {"weakest_stage": None, "win_rate": 0}
+
+        weakest = min(rates, key=rates.get)
+        return {
+            "weakest_stage": weakest,
+            "win_rate": rates[weakest]
+        }
+
+    def stage_cycle_distribution(self):
+        # Quantiles are not additive, so they cannot be re-aggregated from
+        # the crosstab sums; this is the one metric that needs its own pass.
+        grouped = self.df.groupby("deal_stage")["sales_cycle_days"]
+        quantiles = grouped.quantile([0.25, 0.5, 0.75, 0.9]).unstack()
+        stats = pd.DataFrame({
+            "mean": grouped.mean(),
+            "p25": quantiles[0.25],
+            "median": quantiles[0.5],
+            "p75": quantiles[0.75],
+            "p90": quantiles[0.9],
+        }).reindex(self.stage_order())
+
+        return stats.round(2).to_dict(orient="index")
+
+    # -----------------------------
+    # Master Funnel Function
+    # -----------------------------
+
+    def compute_funnel_metrics(self):
+        return {
+            "segment": self.segment,
+            "stage_order": self.stage_order(),
+            "stage_deal_counts": self.stage_deal_counts(),
+            "stage_win_rates": self.stage_win_rates(),
+            "stage_value_at_risk": self.stage_value_at_risk(),
+            "segment_win_rates": self.segment_win_rates(),
+            "weakest_stage": self.weakest_stage(),
+            "stage_cycle_distribution": self.stage_cycle_distribution()
+        }
@@ -1,6 +1,20 @@
 class Guardrails:
     def __init__(self):
         self.intent_map = {
+            "funnel": [
+                "funnel",
+                "deal stage",
+                "by stage",
+                "stage conversion",
+                "losing deals"
+            ],
+            "rep_performance": [
+                "sales rep",
+                "leaderboard",
+                "rep performance",
+                "per rep",
+                "top performers"
+            ],
             "win_rate": ["win rate", "conversion", "close rate"],
             "risk": [
                 "risk",
@@ -1,15 +1,18 @@
-from visualizations import (
-    win_rate_by_source_chart,
-    risk_distribution_chart,
-    acv_distribution_chart,
-    acv_vs_risk_scatter,
-    sales_cycle_distribution,
-    health_score_gauge,
-    win_rate_trend_chart
-)
-
-
 def route_visuals(intent, metrics, df, risk_df, health_score):
+    # plotly is only loaded once a query actually needs a chart
+    from visualizations import (
+        win_rate_by_source_chart,
+        risk_distribution_chart,
+        acv_distribution_chart,
+        acv_vs_risk_scatter,
+        sales_cycle_distribution,
+        health_score_gauge,
+        win_rate_trend_chart,
+        funnel_chart,
+        stage_value_at_risk_chart,
+        rep_leaderboard_chart
+    )
+
     visuals = []
 
     if intent == "win_rate":
@@ -26,6 +29,13 @@ def route_visuals(intent, metrics, df, risk_df, health_score):
     elif intent == "stalled":
         visuals.append(sales_cycle_distribution(df))
 
+    elif intent == "funnel":
+        visuals.append(funnel_chart(metrics["funnel"]))
+        visuals.append(stage_value_at_risk_chart(metrics["funnel"]))
+
+    elif intent == "rep_performance":
+        visuals.append(rep_leaderboard_chart(metrics["rep_performance"]))
+
     elif intent == "pipeline_health":
         visuals.append(health_score_gauge(health_score))
         visuals.append(risk_distribution_chart(risk_df))
@@ -0,0 +1,308 @@
+import numpy as np
+import pandas as pd
+
+
+# Whether a higher value ranks a rep better
+RANKABLE_METRICS = {
+    "win_rate": True,
+    "avg_acv": True,
+    "avg_cycle": False,
+    "stalled_share": False,
+    "avg_risk": False,
+    "deals": True
+}
+
+# Above this share of changed deals a bincount rebuild is cheaper than
+# backing changes out one group at a time.
+INCREMENTAL_MAX_CHANGED = 0.25
+
+
+class RepAnalytics:
+    def __init__(self, df, risk_scores=None):
+        self.median_cycle = df["sales_cycle_days"].median()
+        self.stall_threshold = 1.5 * self.median_cycle
+
+        if risk_scores is not None:
+            df = df.assign(risk_score=risk_scores.reindex(df.index))
+        df = df.drop_duplicates("deal_id", keep="last")
+
+        codes, reps = pd.factorize(df["sales_rep_id"])
+        self.reps = pd.Index(reps)
+
+        # Per-deal state, kept so a changed deal can be backed out of its
+        # rep's totals without rescanning the frame. Removed deals keep
+        # their slot in _deal_ids but are flagged dead in _deal_live.
+        self._deal_ids = pd.Index(df["deal_id"])
+        self._deal_rep = codes.astype(np.int64)
+        self._deal_outcome = df["outcome"].to_numpy(dtype=object)
+        self._deal_live = np.ones(len(df), dtype=bool)
+        self._deal_values = self._deal_contributions(df)
+
+        self._totals = self._aggregate(self._deal_rep, self._deal_values, len(self.reps))
+        self._sort_cache = {}
+
+    # -----------------------------
+    # Grouped Aggregation
+    # -----------------------------
+
+    def _deal_contributions(self, df):
+        if "risk_score" not in df.columns:
+            raise ValueError("Rep analytics needs risk scores: pass risk_scores or a 'risk_score' column.")
+
+        outcome = df["outcome"].str.lower().str.strip()
+        cycle = df["sales_cycle_days"].to_numpy(dtype=np.float64)
+
+        # Columns: deals, closed, won, acv_sum, cycle_sum, stalled, risk_sum
+        return np.column_stack([
+            np.ones(len(df)),
+            outcome.isin(["won", "lost"]).to_numpy(dtype=np.float64),
+            (outcome == "won").to_numpy(dtype=np.float64),
+            df["deal_amount"].to_numpy(dtype=np.float64),
+            cycle,
+            (cycle > self.stall_threshold).astype(np.float64),
+            df["risk_score"].fillna(0).to_numpy(dtype=np.float64),
+        ])
+
+    @staticmethod
+    def _aggregate(rep_codes, values, n_reps):
+        return np.column_stack([
+            np.bincount(rep_codes, weights=values[:, col], minlength=n_reps)
+            for col in range(values.shape[1])
+        ])
+
+    def _register_reps(self, reps):
+        codes = self.reps.get_indexer(reps)
+        missing = codes < 0
+        if missing.any():
+            self.reps = self.reps.append(pd.Index(pd.unique(reps[missing])))
+            codes = self.reps.get_indexer(reps)
+
+            padding = np.zeros((len(self.reps) - len(self._totals), self._totals.shape[1]))
+            self._totals = np.vstack([self._totals, padding])
+        return codes.astype(np.int64)
+
+    # -----------------------------
+    # Incremental Updates
+    # -----------------------------
+
+    def upsert_deals(self, changed_df, risk_scores=None):
+        """Apply new or changed deals to the per-rep totals in place.
+
+        The stall threshold stays at the value computed on construction so
+        that existing contributions remain comparable. If a deal_id appears
+        more than once, the last row wins.
+        """
+        if risk_scores is not None:
+            changed_df = changed_df.assign(risk_score=risk_scores.reindex(changed_df.index))
+        changed_df = changed_df.drop_duplicates("deal_id", keep="last")
+        if len(changed_df) == 0:
+            return
+
+        values = self._deal_contributions(changed_df)
+        rep_codes = self._register_reps(changed_df["sales_rep_id"].to_numpy())
+        outcomes = changed_df["outcome"].to_numpy(dtype=object)
+
+        positions = self._deal_ids.get_indexer(changed_df["deal_id"])
+        existing = positions >= 0
+
+        if existing.any():
+            old = positions[existing]
+            live = old[self._deal_live[old]]
+            self._totals -= self._aggregate(self._deal_rep[live], self._deal_values[live], len(self.reps))
+
+            self._deal_rep[old] = rep_codes[existing]
+            self._deal_values[old] = values[existing]
+            self._deal_outcome[old] = outcomes[existing]
+            self._deal_live[old] = True
+
+        if (~existing).any():
+            new = ~existing
+            self._deal_ids = self._deal_ids.append(pd.Index(changed_df["deal_id"].to_numpy()[new]))
+            self._deal_rep = np.concatenate([self._deal_rep, rep_codes[new]])
+            self._deal_values = np.vstack([self._deal_values, values[new]])
+            self._deal_outcome = np.concatenate([self._deal_outcome, outcomes[new]])
+            self._deal_live = np.concatenate([self._deal_live, np.ones(new.sum(), dtype=bool)])
+
+        self._totals += self._aggregate(rep_codes, values, len(self.reps))
+        self._sort_cache = {}
+
+    def remove_deals(self, deal_ids):
+        positions = self._deal_ids.get_indexer(pd.Index(list(deal_ids)))
+        self._remove_positions(positions[positions >= 0])
+
+    def _remove_positions(self, positions):
+        positions = positions[self._deal_live[positions]]
+        if len(positions) == 0:
+            return
+
+        self._totals -= self._aggregate(self._deal_rep[positions], self._deal_values[positions], len(self.reps))
+        self._deal_live[positions] = False
+        self._sort_cache = {}
+
+    def _changed_rows(self, rows, positions):
+        # Compare raw inputs rather than contributions so unchanged deals
+        # skip the string normalisation in _deal_contributions.
+        values = self._deal_values[positions]
+        return (
+            ~self._deal_live[positions] |
+            (rows["sales_rep_id"].to_numpy() != self.reps.to_numpy()[self._deal_rep[positions]]) |
+            (rows["outcome"].to_numpy(dtype=object) != self._deal_outcome[positions]) |
+            (rows["deal_amount"].to_numpy(dtype=np.float64) != values[:, 3]) |
+            (rows["sales_cycle_days"].to_numpy(dtype=np.float64) != values[:, 4]) |
+            (rows["risk_score"].fillna(0).to_numpy(dtype=np.float64) != values[:, 6])
+        )
+
+    def _diff(self, df, risk_scores=None):
+        """Work out what sync() would change: (upserts, removed positions)."""
+        if risk_scores is not None:
+            df = df.assign(risk_score=risk_scores.reindex(df.index))
+        if "risk_score" not in df.columns:
+            raise ValueError("Rep analytics needs risk scores: pass risk_scores or a 'risk_score' column.")
+
+        known_ids = self._deal_ids.to_numpy()
+        head = min(len(df), len(known_ids))
+
+        if np.array_equal(df["deal_id"].to_numpy()[:head], known_ids[:head]):
+            # Same deals in the same order (optionally with rows appended):
+            # positions line up without a hash lookup.
+            head_rows, tail_rows = df.iloc[:head], df.iloc[head:]
+            positions = np.arange(head)
+        else:
+            df = df.drop_duplicates("deal_id", keep="last")
+            positions = self._deal_ids.get_indexer(df["deal_id"])
+            existing = positions >= 0
+            head_rows, tail_rows = df[existing], df[~existing]
+            positions = positions[existing]
+
+        removed = self._deal_live.copy()
+        removed[positions] = False
+
+        changed = self._changed_rows(head_rows, positions)
+        upserts = pd.concat([head_rows[changed], tail_rows])
+        return upserts, np.flatnonzero(removed)
+
+    def _apply(self, upserts, removed_positions):
+        self._remove_positions(removed_positions)
+        self.upsert_deals(upserts)
+
+    def sync(self, df, risk_scores=None):
+        """Bring the totals in line with ``df``, touching only deals that changed.
+
+        Returns the number of deals that were upserted or removed.
+        """
+        upserts, removed_positions = self._diff(df, risk_scores)
+        self._apply(upserts, removed_positions)
+        return len(upserts.drop_duplicates("deal_id")) + len(removed_positions)
+
+    def _copy(self):
+        # Deal ids and reps are immutable indexes and can be shared; only
+        # the arrays that updates write into are copied.
+        clone = object.__new__(RepAnalytics)
+        clone.__dict__.update(self.__dict__)
+        for name in ("_deal_rep", "_deal_values", "_deal_outcome", "_deal_live", "_totals"):
+            setattr(clone, name, getattr(self, name).copy())
+        clone._sort_cache = {}
+        return clone
+
+    def updated(self, df, risk_scores=None):
+        """Return analytics for a new version of the dataset.
+
+        Reuses these totals incrementally when the stall threshold is
+        unchanged and few deals moved; otherwise rebuilds, which is cheaper
+        once a large share of deals changed (e.g. when risk scores shift).
+        """
+        if 1.5 * df["sales_cycle_days"].median() != self.stall_threshold:
+            return RepAnalytics(df, risk_scores)
+
+        upserts, removed_positions = self._diff(df, risk_scores)
+        if len(upserts) + len(removed_positions) > INCREMENTAL_MAX_CHANGED * max(len(df), 1):
+            return RepAnalytics(df, risk_scores)
+
+        refreshed = self._copy()
+        refreshed._apply(upserts, removed_positions)
+        return refreshed
+
+    # -----------------------------
+    # Per-Rep Metrics
+    # -----------------------------
+
+    def rep_metrics(self):
+        deals, closed, won, acv_sum, cycle_sum, stalled, risk_sum = self._totals.T
+        deals = np.rint(deals)
+        active = np.where(deals > 0, deals, np.nan)
+
+        return {
+            "deals": deals.astype(np.int64),
+            "win_rate": np.divide(won, closed, out=np.zeros_like(won), where=closed > 0.5),
+            "avg_acv": np.nan_to_num(acv_sum / active),
+            "avg_cycle": np.nan_to_num(cycle_sum / active),
+            "stalled_share": np.nan_to_num(stalled / active),
+            "avg_risk": np.nan_to_num(risk_sum / active),
+        }
+
+    def team_medians(self):
+        metrics = self.rep_metrics()
+        active = metrics["deals"] > 0
+        if not active.any():
+            return {name: 0 for name in RANKABLE_METRICS}
+
+        return {
+            name: round(float(np.median(metrics[name][active])), 4)
+            for name in RANKABLE_METRICS
+        }
+
+    # -----------------------------
+    # Leaderboard
+    # -----------------------------
+
+    def _sorted_order(self, sort_by):
+        # Best-first order over reps that currently have deals
+        if sort_by not in self._sort_cache:
+            metrics = self.rep_metrics()
+            active_codes = np.flatnonzero(metrics["deals"] > 0)
+            values = metrics[sort_by][active_codes]
+            if RANKABLE_METRICS[sort_by]:
+                values = -values
+            self._sort_cache[sort_by] = active_codes[np.argsort(values, kind="stable")]
+        return self._sort_cache[sort_by]
+
+    def leaderboard(self, sort_by="win_rate", worst_first=False, page=1, page_size=20):
+        if sort_by not in RANKABLE_METRICS:
+            raise ValueError(f"Cannot rank reps by '{sort_by}'. Choose one of {list(RANKABLE_METRICS)}.")
+
+        order = self._sorted_order(sort_by)
+        if worst_first:
+            order = order[::-1]
+
+        start = (max(page, 1) - 1) * page_size
+        page_codes = order[start:start + page_size]
+
+        metrics = self.rep_metrics()
+        medians = self.team_medians()
+
+        positions = np.arange(start, start + len(page_codes))
+        ranks = len(order) - positions if worst_first else positions + 1
+
+        board = pd.DataFrame({
+            "rank": ranks,
+            "sales_rep_id": self.reps[page_codes].tolist(),
+        })
+        for name in RANKABLE_METRICS:
+            board[name] = metrics[name][page_codes]
+            if name != "deals":
+                board[f"{name}_vs_median"] = board[name] - medians[name]
+
+        return board.round(4)
+
+    def leaderboard_summary(self, sort_by="win_rate", page_size=10):
+        board = self.leaderboard(sort_by=sort_by, page_size=page_size)
+        bottom = self.leaderboard(sort_by=sort_by, worst_first=True, page_size=1)
+
+        return {
+            "total_reps": len(self._sorted_order(sort_by)),
+            "sort_by": sort_by,
+            "team_medians": self.team_medians(),
+            "top_rep": board.iloc[0].to_dict() if len(board) else None,
+            "bottom_rep": bottom.iloc[0].to_dict() if len(bottom) else None,
+            "leaderboard": board.to_dict(orient="records")
+        }
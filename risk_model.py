@@ -1,76 +1,87 @@
-import pandas as pd
+from backends import PandasBackend
+
+
+# Static lead source risk values (can refine later)
+LEAD_SOURCE_RISK = {
+    "Inbound": 0.2,
+    "Outbound": 0.4,
+    "Partner": 0.3,
+    "Referral": 0.25
+}
+
+RISK_WEIGHTS = {
+    "cycle_risk": 0.35,
+    "acv_risk": 0.25,
+    "lead_source_risk": 0.20,
+    "stall_risk": 0.20
+}
 
 
 class RiskModel:
-    def __init__(self, df):
-        self.df = df.copy()
-        self.median_cycle = self.df["sales_cycle_days"].median()
-        self.median_acv = self.df["deal_amount"].median()
+    def __init__(self, df=None, backend=None):
+        self.backend = backend if backend is not None else PandasBackend(df=df.copy())
+        self.median_cycle = self.backend.median("sales_cycle_days")
+        self.median_acv = self.backend.median("deal_amount")
+        self._df = None
+
+    @property
+    def df(self):
+        # Scored frame; computed on first access if compute_risk_score()
+        # has not run yet.
+        if self._df is None:
+            self.compute_risk_score()
+        return self._df
 
     # -----------------------------
     # Risk Components
     # -----------------------------
 
+    def risk_params(self):
+        return {
+            # Normalize cycle days against the longest cycle
+            "max_cycle": self.backend.max("sales_cycle_days"),
+            # Lower ACV = higher risk
+            "median_acv": self.median_acv,
+            "lead_source_risk": LEAD_SOURCE_RISK,
+            "default_source_risk": 0.3,
+            "stall_threshold": 1.5 * self.median_cycle,
+            "weights": RISK_WEIGHTS,
+            "high_risk_threshold": 60,
+            "medium_risk_threshold": 30
+        }
+
     def cycle_risk(self):
-        # Normalize cycle days
-        max_cycle = self.df["sales_cycle_days"].max()
-        return (self.df["sales_cycle_days"] / max_cycle)
+        return self.df["cycle_risk"]
 
     def acv_risk(self):
-        # Lower ACV = higher risk
-        return (self.median_acv - self.df["deal_amount"]) / self.median_acv
+        return self.df["acv_risk"]
 
     def lead_source_risk(self):
-        # Assign static risk values (can refine later)
-        risk_map = {
-            "Inbound": 0.2,
-            "Outbound": 0.4,
-            "Partner": 0.3,
-            "Referral": 0.25
-        }
-        return self.df["lead_source"].map(risk_map).fillna(0.3)
+        return self.df["lead_source_risk"]
 
     def stall_risk(self):
-        threshold = 1.5 * self.median_cycle
-        return (self.df["sales_cycle_days"] > threshold).astype(int)
+        return self.df["stall_risk"]
 
     # -----------------------------
     # Final Risk Score
     # -----------------------------
 
     def compute_risk_score(self):
-        self.df["cycle_risk"] = self.cycle_risk()
-        self.df["acv_risk"] = self.acv_risk()
-        self.df["lead_source_risk"] = self.lead_source_risk()
-        self.df["stall_risk"] = self.stall_risk()
-
-        # Weighted risk score
-        self.df["risk_score"] = (
-            0.35 * self.df["cycle_risk"] +
-            0.25 * self.df["acv_risk"] +
-            0.20 * self.df["lead_source_risk"] +
-            0.20 * self.df["stall_risk"]
-        )
-
-        # Scale to 0–100
-        self.df["risk_score"] = (self.df["risk_score"] * 100).clip(0, 100)
-
-        return self.df
+        # Weighted risk score, scaled to 0–100
+        self._df = self.backend.risk_frame(self.risk_params())
+        return self._df
 
     # -----------------------------
     # Portfolio Risk Summary
     # -----------------------------
 
     def portfolio_risk_summary(self):
-        df = self.compute_risk_score()
-
-        high_risk = df[df["risk_score"] > 60]
-        medium_risk = df[(df["risk_score"] > 30) & (df["risk_score"] <= 60)]
-        low_risk = df[df["risk_score"] <= 30]
+        summary = self.backend.risk_summary(self.risk_params())
+        total = summary["total"]
 
         return {
-            "average_risk_score": round(df["risk_score"].mean(), 2),
-            "high_risk_percentage": round(len(high_risk) / len(df), 4),
-            "medium_risk_percentage": round(len(medium_risk) / len(df), 4),
-            "low_risk_percentage": round(len(low_risk) / len(df), 4)
+            "average_risk_score": round(summary["average_risk_score"], 2),
+            "high_risk_percentage": round(summary["high_risk_count"] / total, 4),
+            "medium_risk_percentage": round(summary["medium_risk_count"] / total, 4),
+            "low_risk_percentage": round(summary["low_risk_count"] / total, 4)
         }
@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+
+
+REQUIRED_COLUMNS = [
+    "deal_id",
+    "created_date",
+    "sales_rep_id",
+    "lead_source",
+    "deal_stage",
+    "deal_amount",
+    "sales_cycle_days",
+    "outcome"
+]
+
+
+class DatasetSnapshot:
+    def __init__(self, file_path, version, source_mtime, backend="pandas", previous=None):
+        self.file_path = file_path
+        self.version = version
+        self.source_mtime = source_mtime
+        self.backend_name = backend
+        self.built_at = time.time()
+
+        # Analytics modules pull in pandas/numpy; importing them here keeps
+        # that cost on the background build thread instead of app start-up.
+        from backends import get_backend
+        from decision_engine import DecisionEngine
+        from risk_model import RiskModel
+        from health_index import HealthIndex
+        from funnel import FunnelAnalytics
+        from rep_analytics import RepAnalytics
+
+        self.engine = DecisionEngine(file_path, backend=get_backend(backend, file_path))
+        self.metrics = self.engine.compute_all_metrics()
+
+        self.risk_model = RiskModel(backend=self.engine.backend)
+        self.risk_df = self.risk_model.compute_risk_score()
+        self.risk_summary = self.risk_model.portfolio_risk_summary()
+
+        self.metrics["funnel"] = FunnelAnalytics(self.risk_df).compute_funnel_metrics()
+
+        # Carry the previous version's per-rep totals forward and only apply
+        # the deals that changed between file versions.
+        if previous is not None:
+            self.rep_analytics = previous.rep_analytics.updated(self.risk_df)
+        else:
+            self.rep_analytics = RepAnalytics(self.risk_df)
+        self.metrics["rep_performance"] = self.rep_analytics.leaderboard_summary()
+
+        self.health_model = HealthIndex(self.metrics, self.risk_summary)
+        self.health_score = self.health_model.compute_health_score()
+        self.health_label = self.health_model.health_label(self.health_score)
+
+    def validate(self):
+        columns = self.engine.backend.columns()
+        missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+        if missing:
+            raise ValueError(f"Dataset is missing required columns: {missing}")
+        if self.metrics["total_deals"] == 0:
+            raise ValueError("Dataset contains no usable deals.")
+        if not 0 <= self.health_score <= 100:
+            raise ValueError(f"Health score out of range: {self.health_score}")
+
+    def age_seconds(self):
+        return time.time() - self.built_at
+
+
+class DatasetRefresher:
+    """Watch the dataset file and swap in freshly built snapshots.
+
+    Readers always get the last good snapshot from current(); rebuilds run
+    on a daemon thread and only replace it once they pass validation. The
+    thread builds the first snapshot as soon as it starts (pre-warm).
+    """
+
+    def __init__(self, file_path, poll_interval=5.0, backend="pandas"):
+        self.file_path = file_path
+        self.poll_interval = poll_interval
+        self.backend = backend
+
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._attempted = threading.Event()
+        self._thread = None
+
+        self.last_error = None
+        self.last_checked = None
+        self._failed_mtime = None
+
+    # -----------------------------
+    # Snapshot Access
+    # -----------------------------
+
+    def current(self, timeout=None):
+        """Return the latest good snapshot.
+
+        If none is built yet, waits up to ``timeout`` seconds for the
+        background pre-warm (or builds synchronously when the watcher is not
+        running). Returns None if no snapshot is available in time.
+        """
+        if self._snapshot is None:
+            if self._thread is not None and self._thread.is_alive():
+                self._attempted.wait(timeout)
+            elif timeout is None:
+                self.refresh()
+        return self._snapshot
+
+    def is_ready(self):
+        return self._snapshot is not None
+
+    def _source_mtime(self):
+        return os.stat(self.file_path).st_mtime_ns
+
+    # -----------------------------
+    # Rebuild + Swap
+    # -----------------------------
+
+    def refresh(self):
+        with self._lock:
+            self.last_checked = time.time()
+            mtime = None
+
+            try:
+                mtime = self._source_mtime()
+                # Skip files already built, and files that already failed to build
+                if mtime == self._failed_mtime:
+                    return False
+                if self._snapshot is not None and mtime == self._snapshot.source_mtime:
+                    return False
+
+                version = self._snapshot.version + 1 if self._snapshot is not None else 1
+                candidate = DatasetSnapshot(
+                    self.file_path, version, mtime, backend=self.backend, previous=self._snapshot
+                )
+                candidate.validate()
+
+            except Exception as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self._failed_mtime = mtime
+                self._attempted.set()
+                if self._snapshot is None:
+                    raise
+                return False
+
+            self._snapshot = candidate
+            self._failed_mtime = None
+            self.last_error = None
+            self._attempted.set()
+            return True
+
+    # -----------------------------
+    # Background Watcher
+    # -----------------------------
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="dataset-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watch(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                # No good snapshot yet; keep polling until the file is valid.
+                pass
+
+            if self._stop.wait(self.poll_interval):
+                break
@@ -0,0 +1,159 @@
+# Parity checks between the pandas and DuckDB metric backends. Every metric,
+# risk summary and per-deal risk score must match the pandas reference
+# implementation on the sample dataset and on a scaled-up copy of it.
+
+import math
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from backends import DuckDBBackend, MetricsBackend, PandasBackend
+from decision_engine import DecisionEngine
+from funnel import FunnelAnalytics
+from rep_analytics import RepAnalytics
+from risk_model import RiskModel
+
+
+DATA_PATH = "data/skygeni_sales_data.csv"
+
+
+def scaled_dataset(tmp_path, copies, suffix=".csv"):
+    base = pd.read_csv(DATA_PATH)
+    frames = []
+    for i in range(copies):
+        frame = base.copy()
+        frame["deal_id"] = frame["deal_id"] + f"_{i}"
+        frames.append(frame)
+    scaled = pd.concat(frames, ignore_index=True)
+
+    path = tmp_path / f"scaled{suffix}"
+    if suffix == ".parquet":
+        scaled.to_parquet(path, index=False)
+    else:
+        scaled.to_csv(path, index=False)
+    return str(path)
+
+
+def assert_same(expected, actual, path="metrics"):
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual), path
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual), path
+        for i, (left, right) in enumerate(zip(expected, actual)):
+            assert_same(left, right, f"{path}[{i}]")
+    elif isinstance(expected, str) or expected is None:
+        assert expected == actual, path
+    else:
+        assert math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-4), f"{path}: {expected} != {actual}"
+
+
+def engines(path, **kwargs):
+    return (
+        DecisionEngine(path, backend=PandasBackend(path, **kwargs)),
+        DecisionEngine(path, backend=DuckDBBackend(path, **kwargs)),
+    )
+
+
+@pytest.mark.parametrize("copies", [1, 20])
+def test_metrics_match(tmp_path, copies):
+    path = DATA_PATH if copies == 1 else scaled_dataset(tmp_path, copies)
+    reference, duck = engines(path)
+
+    assert_same(reference.compute_all_metrics(), duck.compute_all_metrics())
+
+
+@pytest.mark.parametrize("copies", [1, 20])
+def test_risk_summary_match(tmp_path, copies):
+    path = DATA_PATH if copies == 1 else scaled_dataset(tmp_path, copies)
+    reference, duck = engines(path)
+
+    assert_same(
+        RiskModel(backend=reference.backend).portfolio_risk_summary(),
+        RiskModel(backend=duck.backend).portfolio_risk_summary(),
+    )
+
+
+def test_risk_scores_match():
+    reference, duck = engines(DATA_PATH)
+    columns = ["deal_id", "cycle_risk", "acv_risk", "lead_source_risk", "stall_risk", "risk_score"]
+
+    expected = RiskModel(backend=reference.backend).compute_risk_score()[columns]
+    actual = RiskModel(backend=duck.backend).compute_risk_score()[columns]
+
+    pd.testing.assert_frame_equal(
+        expected.sort_values("deal_id").reset_index(drop=True),
+        actual.sort_values("deal_id").reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_filters_match():
+    reference, duck = engines(DATA_PATH, filters={"region": "India"})
+
+    assert reference.backend.count() == duck.backend.count()
+    assert_same(reference.compute_all_metrics(), duck.compute_all_metrics())
+
+
+def test_parquet_source_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = scaled_dataset(tmp_path, 2, suffix=".parquet")
+    csv_path = scaled_dataset(tmp_path, 2)
+
+    assert_same(
+        DecisionEngine(csv_path).compute_all_metrics(),
+        DecisionEngine(path, backend=DuckDBBackend(path)).compute_all_metrics(),
+    )
+
+
+@pytest.mark.parametrize("copies", [1, 20])
+def test_funnel_and_rep_analytics_match(tmp_path, copies):
+    # Both run on the frames each backend materializes (dtypes, index, the
+    # risk_score column), so parity here covers what snapshots actually use.
+    path = DATA_PATH if copies == 1 else scaled_dataset(tmp_path, copies)
+    reference, duck = engines(path)
+
+    expected_risk = RiskModel(backend=reference.backend).compute_risk_score()
+    actual_risk = RiskModel(backend=duck.backend).compute_risk_score()
+
+    assert_same(
+        FunnelAnalytics(expected_risk).compute_funnel_metrics(),
+        FunnelAnalytics(actual_risk).compute_funnel_metrics(),
+    )
+    assert_same(
+        RepAnalytics(expected_risk).leaderboard_summary(),
+        RepAnalytics(actual_risk).leaderboard_summary(),
+    )
+
+
+def test_file_replaced_after_load_does_not_change_results(tmp_path):
+    path = tmp_path / "deals.csv"
+    path.write_text(open(DATA_PATH).read())
+    duck = DecisionEngine(str(path), backend=DuckDBBackend(str(path)))
+    before = duck.compute_all_metrics()
+
+    path.write_text("deal_id,deal_amount\nD1,100\n")
+
+    assert_same(before, duck.compute_all_metrics())
+    assert len(duck.df) == before["total_deals"]
+
+
+def test_columns_match_and_df_reuses_risk_frame():
+    reference, duck = engines(DATA_PATH)
+
+    assert duck.backend.columns() == reference.backend.columns()
+
+    risk_df = RiskModel(backend=duck.backend).compute_risk_score()
+    assert duck.df is risk_df
+
+
+def test_incomplete_backend_fails_on_construction():
+    class PartialBackend(MetricsBackend):
+        def count(self):
+            return 0
+
+    with pytest.raises(TypeError):
+        PartialBackend()
@@ -3,12 +3,17 @@
 from decision_engine import DecisionEngine
 from risk_model import RiskModel
 from health_index import HealthIndex
+from funnel import FunnelAnalytics
+from rep_analytics import RepAnalytics
 
 engine = DecisionEngine("data/skygeni_sales_data.csv")
 metrics = engine.compute_all_metrics()
 
 risk_model = RiskModel(engine.df)
 risk_summary = risk_model.portfolio_risk_summary()
+risk_df = risk_model.df
+funnel = FunnelAnalytics(risk_df).compute_funnel_metrics()
+reps = RepAnalytics(risk_df).leaderboard_summary()
 
 health_model = HealthIndex(metrics, risk_summary)
 health_score = health_model.compute_health_score()
@@ -16,5 +21,7 @@ label = health_model.health_label(health_score)
 
 print("Metrics:", metrics)
 print("Risk Summary:", risk_summary)
+print("Funnel:", funnel)
+print("Rep Leaderboard:", reps)
 print("Pipeline Health Score:", health_score)
 print("Pipeline Status:", label)
\ No newline at end of file
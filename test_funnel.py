@@ -0,0 +1,78 @@
+# Checks for FunnelAnalytics on small hand-built frames: stage ordering,
+# stages without closed deals, and value at risk with and without risk scores.
+
+import pandas as pd
+
+from funnel import STAGE_ORDER, FunnelAnalytics
+
+
+def deals_frame(risk_scores=None):
+    df = pd.DataFrame({
+        "deal_stage": ["Negotiation", "Qualified", "Qualified", "Pilot", "Demo", "Demo", "Proposal"],
+        "product_type": ["Core", "Core", "Enterprise", "Core", "Core", "Enterprise", "Core"],
+        "outcome": ["won", "lost", "won", "lost", "open", "open", "won"],
+        "deal_amount": [1000, 2000, 3000, 4000, 5000, 6000, 7000],
+        "sales_cycle_days": [10, 20, 30, 40, 50, 60, 100],
+    })
+    if risk_scores is not None:
+        df["risk_score"] = risk_scores
+    return df
+
+
+def test_stage_order_follows_funnel_then_unknown_stages():
+    funnel = FunnelAnalytics(deals_frame())
+
+    order = funnel.stage_order()
+
+    known = [stage for stage in STAGE_ORDER if stage in order]
+    assert order[:len(known)] == known
+    assert order == ["Qualified", "Demo", "Proposal", "Negotiation", "Pilot"]
+
+
+def test_stage_without_closed_deals_has_zero_win_rate():
+    metrics = FunnelAnalytics(deals_frame()).compute_funnel_metrics()
+
+    assert metrics["stage_deal_counts"]["Demo"] == 2
+    assert metrics["stage_win_rates"]["Demo"] == 0
+    assert metrics["stage_win_rates"]["Qualified"] == 0.5
+    assert metrics["segment_win_rates"]["Qualified"] == {"Core": 0.0, "Enterprise": 1.0}
+
+
+def test_weakest_stage_is_first_lowest_win_rate_in_funnel_order():
+    weakest = FunnelAnalytics(deals_frame()).weakest_stage()
+
+    assert weakest == {"weakest_stage": "Demo", "win_rate": 0}
+
+
+def test_value_at_risk_uses_risk_score_when_present():
+    scores = [70, 10, 65, 90, 0, 61, 30]
+    value_at_risk = FunnelAnalytics(deals_frame(scores)).stage_value_at_risk()
+
+    assert value_at_risk == {
+        "Qualified": 3000,
+        "Demo": 6000,
+        "Proposal": 0,
+        "Negotiation": 1000,
+        "Pilot": 4000,
+    }
+
+
+def test_value_at_risk_falls_back_to_stalled_deals():
+    # Median cycle is 40 days, so only deals above 60 days count as stalled.
+    value_at_risk = FunnelAnalytics(deals_frame()).stage_value_at_risk()
+
+    assert value_at_risk == {
+        "Qualified": 0,
+        "Demo": 0,
+        "Proposal": 7000,
+        "Negotiation": 0,
+        "Pilot": 0,
+    }
+
+
+def test_cycle_distribution_per_stage():
+    distribution = FunnelAnalytics(deals_frame()).stage_cycle_distribution()
+
+    assert list(distribution) == ["Qualified", "Demo", "Proposal", "Negotiation", "Pilot"]
+    assert distribution["Qualified"]["median"] == 25
+    assert distribution["Demo"]["mean"] == 55
@@ -0,0 +1,195 @@
+# Checks for RepAnalytics: incremental updates must land on the same per-rep
+# totals as a full rebuild, and leaderboards rank by each metric's direction.
+
+import math
+
+import pandas as pd
+import pytest
+
+from rep_analytics import RepAnalytics
+
+
+def deals_frame():
+    return pd.DataFrame({
+        "deal_id": ["D1", "D2", "D3", "D4", "D5", "D6"],
+        "sales_rep_id": ["rep_a", "rep_a", "rep_b", "rep_b", "rep_c", "rep_c"],
+        "outcome": ["won", "lost", "won", "won", "lost", "lost"],
+        "deal_amount": [1000, 2000, 3000, 4000, 500, 700],
+        "sales_cycle_days": [10, 20, 30, 40, 90, 100],
+        "risk_score": [20.0, 40.0, 10.0, 15.0, 80.0, 70.0],
+    })
+
+
+def per_rep(analytics):
+    metrics = analytics.rep_metrics()
+    return {
+        rep: {name: values[code] for name, values in metrics.items()}
+        for code, rep in enumerate(analytics.reps)
+        if metrics["deals"][code] > 0
+    }
+
+
+def assert_same_reps(expected, actual):
+    assert set(expected) == set(actual)
+    for rep in expected:
+        for name in expected[rep]:
+            assert math.isclose(expected[rep][name], actual[rep][name], abs_tol=1e-9), (rep, name)
+
+
+def test_upsert_matches_full_rebuild():
+    base = deals_frame()
+    analytics = RepAnalytics(base)
+
+    changes = pd.DataFrame({
+        "deal_id": ["D1", "D3", "D7"],
+        "sales_rep_id": ["rep_b", "rep_b", "rep_d"],   # D1 moves rep, D3 changes, D7 is new
+        "outcome": ["Won", "Lost ", "won"],
+        "deal_amount": [1000, 3500, 900],
+        "sales_cycle_days": [10, 35, 15],
+        "risk_score": [20.0, 55.0, 5.0],
+    })
+    analytics.upsert_deals(changes)
+
+    updated = pd.concat([base[~base["deal_id"].isin(changes["deal_id"])], changes], ignore_index=True)
+    rebuilt = RepAnalytics(updated)
+
+    assert rebuilt.stall_threshold == analytics.stall_threshold
+    assert_same_reps(per_rep(rebuilt), per_rep(analytics))
+    assert "rep_a" in per_rep(analytics)
+    assert per_rep(analytics)["rep_a"]["deals"] == 1
+
+
+def test_upsert_duplicate_deal_ids_applies_last_row_once():
+    analytics = RepAnalytics(deals_frame())
+
+    changes = pd.DataFrame({
+        "deal_id": ["D2", "D2"],
+        "sales_rep_id": ["rep_a", "rep_a"],
+        "outcome": ["lost", "won"],
+        "deal_amount": [1, 2000],
+        "sales_cycle_days": [20, 20],
+        "risk_score": [40.0, 40.0],
+    })
+    analytics.upsert_deals(changes)
+
+    rep_a = per_rep(analytics)["rep_a"]
+    assert rep_a["deals"] == 2
+    assert rep_a["win_rate"] == 1.0
+    assert rep_a["avg_acv"] == 1500
+
+
+def test_upsert_with_separate_risk_scores():
+    analytics = RepAnalytics(deals_frame())
+
+    changes = deals_frame().drop(columns="risk_score").iloc[[0]]
+    analytics.upsert_deals(changes, pd.Series([60.0], index=changes.index))
+
+    assert per_rep(analytics)["rep_a"]["avg_risk"] == 50.0
+
+
+def test_missing_risk_scores_raise():
+    with pytest.raises(ValueError):
+        RepAnalytics(deals_frame().drop(columns="risk_score"))
+
+
+def test_sync_and_updated_match_full_rebuild():
+    base = deals_frame()
+    analytics = RepAnalytics(base)
+
+    new_version = base[base["deal_id"] != "D6"].copy()
+    new_version.loc[new_version["deal_id"] == "D2", "outcome"] = "won"
+    new_version = pd.concat([new_version, pd.DataFrame({
+        "deal_id": ["D8"],
+        "sales_rep_id": ["rep_c"],
+        "outcome": ["won"],
+        "deal_amount": [800],
+        "sales_cycle_days": [40],
+        "risk_score": [30.0],
+    })], ignore_index=True)
+
+    refreshed = analytics.updated(new_version)
+    rebuilt = RepAnalytics(new_version)
+
+    # Median cycle is unchanged, so this takes the incremental path
+    assert refreshed.stall_threshold == analytics.stall_threshold == rebuilt.stall_threshold
+    assert refreshed is not analytics
+    assert_same_reps(per_rep(rebuilt), per_rep(refreshed))
+    # The original totals are untouched so the previous snapshot stays valid
+    assert_same_reps(per_rep(RepAnalytics(base)), per_rep(analytics))
+
+    assert analytics.sync(new_version) == 3
+
+
+def test_updated_applies_few_changes_incrementally():
+    base = deals_frame()
+    analytics = RepAnalytics(base)
+
+    new_version = base.copy()
+    new_version.loc[new_version["deal_id"] == "D5", "outcome"] = "won"
+
+    refreshed = analytics.updated(new_version)
+
+    # Incremental copies share the immutable deal-id index; rebuilds do not
+    assert refreshed._deal_ids is analytics._deal_ids
+    assert_same_reps(per_rep(RepAnalytics(new_version)), per_rep(refreshed))
+    assert per_rep(analytics)["rep_c"]["win_rate"] == 0
+
+
+def test_sync_without_changes_touches_nothing():
+    analytics = RepAnalytics(deals_frame())
+
+    assert analytics.sync(deals_frame()) == 0
+
+
+def test_removed_deal_can_come_back():
+    base = deals_frame()
+    analytics = RepAnalytics(base)
+
+    analytics.remove_deals(["D1"])
+    assert analytics.sync(base) == 1
+
+    assert_same_reps(per_rep(RepAnalytics(base)), per_rep(analytics))
+
+
+def test_updated_rebuilds_when_stall_threshold_moves():
+    base = deals_frame()
+    analytics = RepAnalytics(base)
+
+    shifted = base.assign(sales_cycle_days=base["sales_cycle_days"] * 2)
+    refreshed = analytics.updated(shifted)
+
+    assert refreshed.stall_threshold == 2 * analytics.stall_threshold
+    assert_same_reps(per_rep(RepAnalytics(shifted)), per_rep(refreshed))
+
+
+def test_leaderboard_ranks_by_metric_direction():
+    analytics = RepAnalytics(deals_frame())
+
+    assert analytics.leaderboard("win_rate").iloc[0]["sales_rep_id"] == "rep_b"
+    assert analytics.leaderboard("avg_cycle").iloc[0]["sales_rep_id"] == "rep_a"
+    assert analytics.leaderboard("avg_risk").iloc[0]["sales_rep_id"] == "rep_b"
+    assert analytics.leaderboard("stalled_share").iloc[-1]["sales_rep_id"] == "rep_c"
+
+    worst = analytics.leaderboard("avg_risk", worst_first=True, page_size=1).iloc[0]
+    assert worst["sales_rep_id"] == "rep_c"
+    assert worst["rank"] == 3
+
+
+def test_reps_without_deals_are_not_ranked():
+    analytics = RepAnalytics(deals_frame())
+    analytics.remove_deals(["D5", "D6"])
+
+    summary = analytics.leaderboard_summary()
+
+    assert summary["total_reps"] == 2
+    assert summary["bottom_rep"]["sales_rep_id"] == "rep_a"
+    assert "rep_c" not in [row["sales_rep_id"] for row in summary["leaderboard"]]
+
+
+def test_leaderboard_paging():
+    analytics = RepAnalytics(deals_frame())
+
+    page = analytics.leaderboard("win_rate", page=2, page_size=2)
+
+    assert list(page["rank"]) == [3]
+    assert list(page["sales_rep_id"]) == ["rep_c"]
@@ -0,0 +1,106 @@
+# Checks for DatasetRefresher: unchanged files are skipped, a failed rebuild
+# keeps the last good snapshot, and versions only move on a successful swap.
+
+import os
+import shutil
+
+import pytest
+
+import snapshot
+from snapshot import DatasetRefresher
+
+
+DATA_PATH = "data/skygeni_sales_data.csv"
+
+
+class CountingSnapshot(snapshot.DatasetSnapshot):
+    builds = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingSnapshot.builds += 1
+        super().__init__(*args, **kwargs)
+
+
+@pytest.fixture
+def counting(monkeypatch):
+    CountingSnapshot.builds = 0
+    monkeypatch.setattr(snapshot, "DatasetSnapshot", CountingSnapshot)
+    return CountingSnapshot
+
+
+def write_valid(path, mtime_ns):
+    shutil.copy(DATA_PATH, path)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def write_broken(path, mtime_ns):
+    path.write_text("deal_id,deal_amount\nD1,100\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_mtime_is_skipped(tmp_path, counting):
+    path = tmp_path / "deals.csv"
+    write_valid(path, 1_000_000_000)
+    refresher = DatasetRefresher(str(path))
+
+    assert refresher.refresh() is True
+    first = refresher.current()
+
+    assert refresher.refresh() is False
+    assert refresher.current() is first
+    assert counting.builds == 1
+
+
+def test_version_bumps_on_successful_swap(tmp_path, counting):
+    path = tmp_path / "deals.csv"
+    write_valid(path, 1_000_000_000)
+    refresher = DatasetRefresher(str(path))
+    refresher.refresh()
+
+    write_valid(path, 2_000_000_000)
+
+    assert refresher.refresh() is True
+    assert refresher.current().version == 2
+    assert refresher.current().source_mtime == 2_000_000_000
+
+
+def test_failed_rebuild_keeps_last_good_snapshot(tmp_path, counting):
+    path = tmp_path / "deals.csv"
+    write_valid(path, 1_000_000_000)
+    refresher = DatasetRefresher(str(path))
+    refresher.refresh()
+    good = refresher.current()
+
+    write_broken(path, 2_000_000_000)
+
+    assert refresher.refresh() is False
+    assert refresher.current() is good
+    assert refresher.last_error is not None
+
+    # The broken file is not rebuilt again until it changes
+    assert refresher.refresh() is False
+    assert counting.builds == 2
+
+    write_valid(path, 3_000_000_000)
+
+    assert refresher.refresh() is True
+    assert refresher.current().version == 2
+    assert refresher.last_error is None
+
+
+def test_bad_initial_file_is_not_rebuilt_until_it_changes(tmp_path, counting):
+    path = tmp_path / "deals.csv"
+    write_broken(path, 1_000_000_000)
+    refresher = DatasetRefresher(str(path))
+
+    with pytest.raises(Exception):
+        refresher.refresh()
+
+    assert refresher.refresh() is False
+    assert refresher.current(timeout=0) is None
+    assert counting.builds == 1
+
+    write_valid(path, 2_000_000_000)
+
+    assert refresher.refresh() is True
+    assert refresher.current().version == 1
@@ -94,3 +94,54 @@ def win_rate_trend_chart(df):
         labels={"outcome": "Win Rate"}
     )
     return fig
+
+
+def funnel_chart(funnel_metrics):
+    stages = funnel_metrics["stage_order"]
+    counts = [funnel_metrics["stage_deal_counts"][stage] for stage in stages]
+
+    # A deal sitting at stage k has passed through every earlier stage, so
+    # the funnel shows deals that reached each stage (stage index >= k).
+    reached = [sum(counts[i:]) for i in range(len(stages))]
+    conversion = [100.0] + [
+        (reached[i] / reached[i - 1] * 100) if reached[i - 1] else 0
+        for i in range(1, len(stages))
+    ]
+
+    fig = go.Figure(go.Funnel(
+        y=stages,
+        x=reached,
+        text=[f"{rate:.1f}% from previous stage" for rate in conversion],
+        textinfo="value+text"
+    ))
+    fig.update_layout(title="Deal Stage Funnel (Deals Reaching Each Stage)")
+    return fig
+
+
+def stage_value_at_risk_chart(funnel_metrics):
+    stages = funnel_metrics["stage_order"]
+    values = [funnel_metrics["stage_value_at_risk"][stage] for stage in stages]
+
+    fig = px.bar(
+        x=stages,
+        y=values,
+        labels={"x": "Deal Stage", "y": "Value at Risk"},
+        title="Value at Risk by Deal Stage"
+    )
+    return fig
+
+
+def rep_leaderboard_chart(rep_summary):
+    board = rep_summary["leaderboard"]
+    reps = [row["sales_rep_id"] for row in board]
+    values = [row["win_rate"] * 100 for row in board]
+    median = rep_summary["team_medians"]["win_rate"] * 100
+
+    fig = px.bar(
+        x=reps,
+        y=values,
+        labels={"x": "Sales Rep", "y": "Win Rate (%)"},
+        title="Sales Rep Leaderboard (Win Rate)"
+    )
+    fig.add_hline(y=median, line_dash="dash", annotation_text="Team median")
+    return fig